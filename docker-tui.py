@@ -23,18 +23,166 @@ Logs view:
 """
 
 import asyncio
+import os
+import ssl
+import time
+from collections import Counter
 from docker import from_env
 from docker.errors import DockerException
+from docker.utils import version_lt
 from textual.app import App, ComposeResult
 from textual.widgets import DataTable, Header, Footer, Static, RichLog
 from textual.containers import Container, Vertical, Horizontal
 from textual.binding import Binding
+from textual.message import Message
+from rich.markup import escape
 from rich.text import Text
-from datetime import datetime
+from datetime import datetime, timezone
 from textual import events
 
 client = from_env()
 
+# one-shot stats need API 1.41 (Engine 20.10); older daemons get the
+# two-sample call, which still works against the cached previous sample
+_STATS_KWARGS = (
+    {'stream': False} if version_lt(client.api.api_version, '1.41')
+    else {'stream': False, 'one_shot': True}
+)
+
+# Shared, immutable cell renderables for the container table
+STATUS_RUNNING = Text("● running", style="bold green")
+STATUS_EXITED = Text("■ exited", style="bold red")
+STATUS_PAUSED = Text("‖ paused", style="bold yellow")
+STATUS_MAP = {
+    "running": STATUS_RUNNING,
+    "exited": STATUS_EXITED,
+    "paused": STATUS_PAUSED,
+}
+
+_UNSET = object()  # Sentinel for "not computed yet"
+
+_KB = 1 << 10
+_MB = 1 << 20
+_GB = 1 << 30
+
+
+def _fmt_bytes(n: int) -> str:
+    """Format a byte count as KB/MB/GB"""
+    if n >= _GB:
+        return f"{n / _GB:.2f}GB"
+    elif n >= _MB:
+        return f"{n / _MB:.1f}MB"
+    else:
+        return f"{n / _KB:.1f}KB"
+
+
+def _format_port(port: dict) -> str:
+    """Format one entry of the list payload's Ports as host→container/proto"""
+    container_port = f"{port['PrivatePort']}/{port['Type']}"
+    if 'PublicPort' in port:
+        return f"{port['PublicPort']}→{container_port}"
+    return container_port
+
+
+def _format_ports(ports: list[dict]) -> str:
+    """Format port mappings for the table, showing at most two"""
+    if not ports:
+        return "-"
+    if len(ports) == 1:
+        return _format_port(ports[0])
+    text = _format_port(ports[0]) + ", " + _format_port(ports[1])
+    return text + "..." if len(ports) > 2 else text
+
+
+_LAST_TS_STR: tuple[int, str] = (0, "")  # (unix second, formatted HH:MM:SS)
+
+
+def _wall_clock_str() -> str:
+    """Current local time as HH:MM:SS, formatted at most once per second"""
+    global _LAST_TS_STR
+    now = int(time.time())
+    if _LAST_TS_STR[0] != now:
+        _LAST_TS_STR = (now, datetime.fromtimestamp(now).strftime('%H:%M:%S'))
+    return _LAST_TS_STR[1]
+
+
+# cgroup v2 layout, probed once at startup; the path depends on docker's cgroup driver
+_CGROUP_V2 = os.path.exists("/sys/fs/cgroup/cgroup.controllers")
+_CGROUP_DIRS = (
+    "/sys/fs/cgroup/system.slice/docker-{}.scope",  # systemd driver
+    "/sys/fs/cgroup/docker/{}",  # cgroupfs driver
+)
+
+
+def _read_sysfs(path: str) -> bytes:
+    """Read a small pseudo-file in a single syscall"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.pread(fd, 4096, 0)
+    finally:
+        os.close(fd)
+
+
+def _find_cgroup_dir(cid: str) -> str | None:
+    """Return the container's readable cgroup v2 directory, or None"""
+    for template in _CGROUP_DIRS:
+        base = template.format(cid)
+        if os.access(f"{base}/cpu.stat", os.R_OK):
+            return base
+    return None
+
+
+def _read_cgroup_stats(metas: dict[str, dict]) -> dict[str, dict]:
+    """Read CPU/memory usage from cgroup v2 files, bypassing the daemon"""
+    # Results mirror the one-shot stats API payload; unreadable containers are left out
+    if not _CGROUP_V2:
+        return {}
+    
+    try:
+        # System CPU time as docker computes it: user..softirq jiffies in ns
+        cpu_line = _read_sysfs("/proc/stat").split(b'\n', 1)[0]
+        jiffies = sum(int(v) for v in cpu_line.split()[1:8])
+        system_ns = jiffies * 1_000_000_000 // os.sysconf('SC_CLK_TCK')
+        host_mem = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (OSError, ValueError):
+        return {}
+    
+    result = {}
+    for cid, meta in metas.items():
+        # Probe the cgroup path once per container; None means "use the daemon"
+        base = meta['cgroup_dir']
+        if base is _UNSET:
+            base = meta['cgroup_dir'] = _find_cgroup_dir(cid)
+        if base is None:
+            continue
+        
+        try:
+            cpu_stat = _read_sysfs(f"{base}/cpu.stat")
+            mem_current = int(_read_sysfs(f"{base}/memory.current"))
+            mem_max = _read_sysfs(f"{base}/memory.max").strip()
+        except (OSError, ValueError):
+            continue
+        
+        usage_usec = next(
+            (int(line.split()[1]) for line in cpu_stat.splitlines() if line.startswith(b'usage_usec ')),
+            None,
+        )
+        if usage_usec is None:
+            continue
+        
+        result[cid] = {
+            'cpu_stats': {
+                'cpu_usage': {'total_usage': usage_usec * 1000},
+                'system_cpu_usage': system_ns,
+            },
+            'memory_stats': {
+                'usage': mem_current,
+                'limit': host_mem if mem_max == b'max' else int(mem_max),
+            },
+        }
+    return result
+
+
 class StatsBar(Static):
     """Display overall Docker stats"""
     
@@ -42,21 +190,14 @@ class StatsBar(Static):
         yield Static("", id="stats-content")
     
     def update_stats(self, total: int, running: int, stopped: int, paused: int):
-        stats_text = Text()
-        stats_text.append("Containers: ", style="bold cyan")
-        stats_text.append(f"{total} ", style="bold white")
-        stats_text.append("Running: ", style="bold green")
-        stats_text.append(f"{running} ", style="bold white")
-        stats_text.append("Stopped: ", style="bold red")
-        stats_text.append(f"{stopped} ", style="bold white")
-        if paused > 0:
-            stats_text.append("Paused: ", style="bold yellow")
-            stats_text.append(f"{paused} ", style="bold white")
-        
-        stats_text.append(" │ ", style="dim")
-        stats_text.append(f"Last update: {datetime.now().strftime('%H:%M:%S')}", style="dim italic")
-        
-        self.query_one("#stats-content", Static).update(stats_text)
+        paused_markup = f"[bold yellow]Paused:[/] [bold white]{paused}[/] " if paused > 0 else ""
+        self.query_one("#stats-content", Static).update(
+            f"[bold cyan]Containers:[/] [bold white]{total}[/] "
+            f"[bold green]Running:[/] [bold white]{running}[/] "
+            f"[bold red]Stopped:[/] [bold white]{stopped}[/] "
+            f"{paused_markup}"
+            f"[dim] │ [/][dim italic]Last update: {_wall_clock_str()}[/]"
+        )
 
 
 class LogsView(Container):
@@ -68,7 +209,16 @@ class LogsView(Container):
         self.container_name = container_name
         self.log_task = None
         self.stats_task = None
+        self.flush_task = None
         self.running = False
+        self._log_buffer: list[str] = []  # Lines waiting to be written to the panel
+        self._last_sample = _UNSET  # Last stats sample rendered by _update_stats
+        self._log_socket = None  # Attach socket returned by docker-py
+        self._log_sock = None  # Underlying non-blocking socket
+        self._log_fd = None  # Registered with the event loop via add_reader
+        self._log_multiplexed = True  # Non-TTY output is framed per stream
+        self._log_frames = bytearray()  # Undecoded multiplexed frame data
+        self._log_pending = b""  # Partial line carried over between reads
     
     def compose(self) -> ComposeResult:
         """Create the logs view layout"""
@@ -77,7 +227,7 @@ class LogsView(Container):
         yield Static("Loading stats...", id="container-stats")
         
         # Logs panel
-        yield RichLog(id="logs-panel", wrap=True, highlight=True, markup=True)
+        yield RichLog(id="logs-panel", wrap=True, highlight=True, markup=True, max_lines=5000)
         yield Static("Press [bold cyan]q[/] or [bold cyan]ESC[/] to return to container list", id="logs-footer")
     
     async def on_mount(self):
@@ -91,112 +241,182 @@ class LogsView(Container):
         # Start background tasks
         self.log_task = asyncio.create_task(self._stream_logs())
         self.stats_task = asyncio.create_task(self._update_stats())
+        self.flush_task = asyncio.create_task(self._flush_logs())
     
     async def _stream_logs(self):
-        """Stream container logs in real-time"""
+        """Show recent logs, then follow new output as the socket becomes readable"""
         try:
-            container = client.containers.get(self.container_id)
+            container = await asyncio.to_thread(client.containers.get, self.container_id)
+            self._log_multiplexed = not container.attrs['Config'].get('Tty', False)
             
             # Get last 100 lines of logs
             self.logs_panel.write("[dim]Loading last 100 log lines...[/dim]")
-            initial_logs = container.logs(tail=100, timestamps=True).decode('utf-8', errors='replace')
-            
-            for line in initial_logs.strip().split('\n'):
-                if line:
-                    self.logs_panel.write(line)
-            
-            self.logs_panel.write("[dim]--- Streaming new logs ---[/dim]")
-            
-            # Stream new logs
-            log_stream = container.logs(stream=True, follow=True, timestamps=True)
-            
-            for log_line in log_stream:
-                if not self.running:
-                    break
-                
-                decoded_line = log_line.decode('utf-8', errors='replace').strip()
-                if decoded_line:
-                    self.logs_panel.write(decoded_line)
-                
-                # Allow other tasks to run
-                await asyncio.sleep(0.01)
+            initial_logs = await asyncio.to_thread(container.logs, tail=100, timestamps=True)
+            initial_logs = initial_logs.decode('utf-8', errors='replace').rstrip()
+            if initial_logs:
+                self.logs_panel.write(escape(initial_logs))
         
         except Exception as e:
-            self.logs_panel.write(f"[bold red]Error streaming logs: {str(e)}[/bold red]")
+            self.logs_panel.write(f"[bold red]Error streaming logs: {escape(str(e))}[/bold red]")
+            return
+        
+        # Attach after the tail so no line is shown twice; output written in
+        # between the two calls is not shown
+        try:
+            self._log_socket = await asyncio.to_thread(
+                client.api.attach_socket,
+                self.container_id,
+                params={'stdout': 1, 'stderr': 1, 'stream': 1},
+            )
+        except Exception as e:
+            # The daemon refuses to attach to paused or restarting containers
+            self.logs_panel.write(f"[dim]--- Live logs unavailable: {escape(str(e))} ---[/dim]")
+            return
+        
+        self.logs_panel.write("[dim]--- Streaming new logs ---[/dim]")
+        
+        try:
+            # Wake only when the daemon has sent new output
+            self._log_sock = getattr(self._log_socket, '_sock', self._log_socket)
+            self._log_sock.setblocking(False)
+            self._log_fd = self._log_sock.fileno()
+            asyncio.get_running_loop().add_reader(self._log_fd, self._on_log_readable)
+        
+        except Exception as e:
+            self._close_log_socket()
+            self.logs_panel.write(f"[bold red]Error streaming logs: {escape(str(e))}[/bold red]")
+    
+    def _on_log_readable(self):
+        """Read available log output and buffer complete lines"""
+        try:
+            data = self._log_sock.recv(65536)
+            # Over TLS, bytes already decrypted inside the SSL object don't
+            # wake add_reader again; drain them now
+            if data and isinstance(self._log_sock, ssl.SSLSocket):
+                while self._log_sock.pending():
+                    data += self._log_sock.recv(65536)
+        except (BlockingIOError, ssl.SSLWantReadError):
+            # Nothing to read yet, or only part of a TLS record has arrived
+            return
+        except OSError as e:
+            self._close_log_socket()
+            self._log_buffer.append(f"[bold red]Error streaming logs: {escape(str(e))}[/bold red]")
+            return
+        
+        if not data:
+            # Container stopped or was removed
+            self._close_log_socket()
+            self._log_buffer.append("[dim]--- Log stream ended ---[/dim]")
+            return
+        
+        if self._log_multiplexed:
+            data = self._demux_log_frames(data)
+        
+        *lines, self._log_pending = (self._log_pending + data).split(b'\n')
+        if not lines:
+            return
+        
+        # Attached output carries no timestamps; use the time it arrived.
+        # Container output is escaped so stray [tags] can't break the panel markup.
+        stamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        for line in lines:
+            decoded_line = line.decode('utf-8', errors='replace').strip()
+            if decoded_line:
+                self._log_buffer.append(f"{stamp} {escape(decoded_line)}")
+    
+    def _demux_log_frames(self, data: bytes) -> bytes:
+        """Strip the 8-byte stream headers from multiplexed attach output"""
+        self._log_frames += data
+        payload = bytearray()
+        while len(self._log_frames) >= 8:
+            end = 8 + int.from_bytes(self._log_frames[4:8], 'big')
+            if len(self._log_frames) < end:
+                break
+            payload += self._log_frames[8:end]
+            del self._log_frames[:end]
+        return bytes(payload)
+    
+    def _close_log_socket(self):
+        """Stop watching and close the attach socket"""
+        if self._log_fd is not None:
+            asyncio.get_running_loop().remove_reader(self._log_fd)
+            self._log_fd = None
+        
+        if self._log_socket is not None:
+            self._log_socket.close()
+            if self._log_sock is not None:
+                self._log_sock.close()
+            self._log_socket = None
+            self._log_sock = None
+    
+    async def _flush_logs(self):
+        """Write buffered log lines to the panel in batches"""
+        while self.running:
+            # Cap panel updates at ~20/s regardless of log volume
+            await asyncio.sleep(0.05)
+            if self._log_buffer:
+                lines, self._log_buffer = self._log_buffer, []
+                try:
+                    self.logs_panel.write("\n".join(lines))
+                except Exception as e:
+                    # Stop reading so the buffer can't grow unflushed
+                    self._close_log_socket()
+                    self._log_buffer.clear()
+                    self.logs_panel.write(f"[bold red]Error writing logs: {escape(str(e))}[/bold red]")
+                    break
     
     async def _update_stats(self):
-        """Update container stats periodically"""
+        """Render container stats published by the main refresh loop"""
         while self.running:
-            try:
-                container = client.containers.get(self.container_id)
-                
-                # Check if container is running
-                container.reload()
-                if container.status != "running":
-                    stats_text = Text()
-                    stats_text.append("Status: ", style="bold yellow")
-                    stats_text.append(f"{container.status}", style="yellow")
-                    self.stats_widget.update(stats_text)
-                    await asyncio.sleep(2)
-                    continue
-                
-                # Get stats (non-streaming)
-                stats = container.stats(stream=False)
-                
-                # Calculate CPU percentage
-                cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
-                           stats['precpu_stats']['cpu_usage']['total_usage']
-                system_delta = stats['cpu_stats']['system_cpu_usage'] - \
-                              stats['precpu_stats']['system_cpu_usage']
-                
-                cpu_percent = 0.0
-                if system_delta > 0 and cpu_delta > 0:
-                    num_cpus = len(stats['cpu_stats']['cpu_usage'].get('percpu_usage', [1]))
-                    cpu_percent = (cpu_delta / system_delta) * num_cpus * 100
-                
-                # Calculate memory usage
-                mem_usage = stats['memory_stats'].get('usage', 0)
-                mem_limit = stats['memory_stats'].get('limit', 0)
+            sample = self.app._stats_bus.get(self.container_id)
+            
+            # Stopped or idle containers often publish the same sample
+            # every refresh; only re-render when something changed
+            if sample != self._last_sample:
+                self._last_sample = sample
                 
-                # Format memory
-                def format_bytes(bytes_val):
-                    if bytes_val >= 1024**3:
-                        return f"{bytes_val / 1024**3:.2f}GB"
-                    elif bytes_val >= 1024**2:
-                        return f"{bytes_val / 1024**2:.1f}MB"
+                if sample is None:
+                    # Container is gone or hidden by the running-only filter
+                    stats_markup = "[bold yellow]Status:[/] [yellow]unavailable[/]"
+                elif sample['status'] != "running":
+                    stats_markup = f"[bold yellow]Status:[/] [yellow]{escape(sample['status'])}[/]"
+                elif 'error' in sample:
+                    # Container might have stopped
+                    stats_markup = f"[bold red]Error:[/] [red]{escape(sample['error'])}[/]"
+                else:
+                    cpu_percent = sample['cpu_percent']
+                    mem_usage = sample['mem_usage']
+                    mem_limit = sample['mem_limit']
+                    
+                    if cpu_percent is None:
+                        # Needs two samples from the main refresh
+                        cpu_markup = "[dim]-[/]"
                     else:
-                        return f"{bytes_val / 1024:.1f}KB"
-                
-                # Create stats display
-                stats_text = Text()
-                stats_text.append("CPU: ", style="bold cyan")
-                stats_text.append(f"{cpu_percent:.1f}%", style="bold green" if cpu_percent < 50 else "bold yellow")
-                stats_text.append("  │  ", style="dim")
-                stats_text.append("Memory: ", style="bold cyan")
-                stats_text.append(f"{format_bytes(mem_usage)}", style="bold white")
-                stats_text.append(" / ", style="dim")
-                stats_text.append(f"{format_bytes(mem_limit)}", style="bold white")
+                        cpu_style = "bold green" if cpu_percent < 50 else "bold yellow"
+                        cpu_markup = f"[{cpu_style}]{cpu_percent:.1f}%[/]"
+                    
+                    # Memory percentage
+                    mem_percent_markup = ""
+                    if mem_limit > 0:
+                        mem_percent = (mem_usage / mem_limit) * 100
+                        mem_percent_markup = f"[dim] ({mem_percent:.1f}%)[/]"
+                    
+                    # Create stats display
+                    stats_markup = (
+                        f"[bold cyan]CPU:[/] {cpu_markup}[dim]  │  [/]"
+                        f"[bold cyan]Memory:[/] [bold white]{_fmt_bytes(mem_usage)}[/]"
+                        f"[dim] / [/][bold white]{_fmt_bytes(mem_limit)}[/]{mem_percent_markup}"
+                    )
                 
-                # Memory percentage
-                if mem_limit > 0:
-                    mem_percent = (mem_usage / mem_limit) * 100
-                    stats_text.append(f" ({mem_percent:.1f}%)", style="dim")
-                
-                self.stats_widget.update(stats_text)
-                
-            except Exception as e:
-                # Container might have stopped
-                stats_text = Text()
-                stats_text.append("Error: ", style="bold red")
-                stats_text.append(str(e), style="red")
-                self.stats_widget.update(stats_text)
+                self.stats_widget.update(stats_markup)
             
-            # Update every 1.5 seconds
-            await asyncio.sleep(1.5)
+            # Wait for the next main refresh
+            await self.app._stats_event.wait()
     
     async def cleanup(self):
         """Cancel background tasks when leaving view"""
         self.running = False
+        self._close_log_socket()
         
         if self.log_task and not self.log_task.done():
             self.log_task.cancel()
@@ -211,6 +431,21 @@ class LogsView(Container):
                 await self.stats_task
             except asyncio.CancelledError:
                 pass
+        
+        if self.flush_task and not self.flush_task.done():
+            self.flush_task.cancel()
+            try:
+                await self.flush_task
+            except asyncio.CancelledError:
+                pass
+
+
+class RefreshMessage(Message):
+    """Snapshot of container data collected by the background refresher"""
+    
+    def __init__(self, snapshot: dict):
+        super().__init__()
+        self.snapshot = snapshot
 
 
 class DockerTUI(App):
@@ -321,6 +556,13 @@ class DockerTUI(App):
         super().__init__()
         self.show_all = True
         self.container_ids = {}
+        self._meta_cache: dict[str, dict] = {}  # Immutable per-container metadata
+        self._prev_cpu: dict[str, tuple[int, int]] = {}  # id -> (total_usage, system_usage)
+        self._row_state: dict[str, tuple] = {}  # id -> last rendered row values
+        self._stats_bus: dict[str, dict] = {}  # id -> latest stats sample, read by LogsView
+        self._stats_event = asyncio.Event()  # Pulsed after each refresh
+        self._action_running = False  # One container action in flight at a time
+        self._refresh_now = asyncio.Event()  # Set to make the refresher run early
         self.current_logs_view = None  # Track active logs view
         self.in_logs_view = False  # UI state flag
     
@@ -331,141 +573,240 @@ class DockerTUI(App):
             yield DataTable(cursor_type="row", zebra_stripes=True)
         yield Footer()
     
-    def on_mount(self):
+    async def on_mount(self):
         self.table = self.query_one(DataTable)
         self.stats_bar = self.query_one(StatsBar)
         
         # Setup table columns with better formatting
-        self.table.add_columns(
+        self._column_keys = self.table.add_columns(
             "ID", "NAME", "STATUS", "IMAGE", "PORTS", "CPU %", "MEM", "UPTIME"
         )
         self.table.cursor_type = "row"
         self.table.zebra_stripes = True
         
-        # Start periodic refresh
-        self.set_interval(10.0, self.refresh_data)
-        self.refresh_data()
+        # Start background refresh
+        self._bg = asyncio.create_task(self._refresher())
+    
+    async def on_unmount(self):
+        """Stop the background refresh"""
+        self._bg.cancel()
+    
+    async def _refresher(self):
+        """Collect container data in the background every 10 seconds"""
+        while True:
+            # Cleared before collecting so a request made mid-collect triggers another pass
+            self._refresh_now.clear()
+            try:
+                self.post_message(RefreshMessage(await self._collect()))
+            except DockerException as e:
+                self.notify(f"Docker error: {str(e)}", severity="error")
+            except Exception as e:
+                # e.g. requests' ConnectionError while the daemon restarts;
+                # keep retrying so the view recovers once it is back
+                self.notify(f"Refresh error: {str(e)}", severity="error")
+            
+            try:
+                await asyncio.wait_for(self._refresh_now.wait(), timeout=10.0)
+            except asyncio.TimeoutError:
+                pass
     
     def refresh_data(self):
-        """Refresh container data"""
-        try:
-            self.table.clear()
-            self.container_ids.clear()
+        """Refresh container data immediately"""
+        # Wake the background refresher rather than collecting here, so
+        # there is only ever one _collect running and snapshots stay in order
+        self._refresh_now.set()
+    
+    def on_refresh_message(self, message: RefreshMessage):
+        """Apply a snapshot posted by the background refresher"""
+        self._apply_snapshot(message.snapshot)
+    
+    async def _collect(self) -> dict:
+        """Fetch containers and stats and build the rows to display"""
+        show_all = self.show_all
+        
+        # Raw list payload: one HTTP call, no per-container inspect
+        containers = await asyncio.to_thread(client.api.containers, all=show_all)
+        
+        # Metadata that doesn't change over the container's lifetime
+        metas = {}
+        for c in containers:
+            cid = c['Id']
+            meta = self._meta_cache.get(cid)
+            if meta is None:
+                meta = self._build_meta(c)
+                self._meta_cache[cid] = meta
+            metas[cid] = meta
+        
+        # Read stats from cgroup files where possible, then fetch the rest
+        # from the daemon concurrently
+        running_metas = {c['Id']: metas[c['Id']] for c in containers if c['State'] == "running"}
+        running_ids = list(running_metas)
+        stats_by_id = await asyncio.to_thread(_read_cgroup_stats, running_metas)
+        api_ids = [cid for cid in running_ids if cid not in stats_by_id]
+        stats_list = await asyncio.gather(
+            *(asyncio.to_thread(client.api.stats, cid, **_STATS_KWARGS)
+              for cid in api_ids),
+            return_exceptions=True,
+        )
+        stats_by_id.update(zip(api_ids, stats_list))
+        
+        now_utc = datetime.now(timezone.utc)
+        stats_bus = {}
+        rows = {}
+        status_counts = Counter()
+        
+        for c in containers:
+            cid = c['Id']
+            meta = metas[cid]
             
-            containers = client.containers.list(all=self.show_all)
+            # Short ID
+            short_id = cid[:12]
             
-            # Calculate stats
-            running = sum(1 for c in containers if c.status == "running")
-            stopped = sum(1 for c in containers if c.status == "exited")
-            paused = sum(1 for c in containers if c.status == "paused")
+            # Container name
+            name = Text(meta['name'], style="bold cyan")
             
-            self.stats_bar.update_stats(len(containers), running, stopped, paused)
+            # Status with color coding
+            status = c['State']
+            status_counts[status] += 1
+            status_text = STATUS_MAP.get(status) or Text(f"○ {status}", style="dim")
             
-            for idx, c in enumerate(containers):
-                # Store container ID for actions
-                self.container_ids[idx] = c.id
-                
-                # Short ID
-                short_id = c.short_id
-                
-                # Container name
-                name = Text(c.name, style="bold cyan")
-                
-                # Status with color coding
-                status = c.status
-                if status == "running":
-                    status_text = Text("● running", style="bold green")
-                elif status == "exited":
-                    status_text = Text("■ exited", style="bold red")
-                elif status == "paused":
-                    status_text = Text("‖ paused", style="bold yellow")
-                else:
-                    status_text = Text(f"○ {status}", style="dim")
-                
-                # Image name (shortened)
-                image = c.image.tags[0] if c.image.tags else c.image.short_id
-                if len(image) > 30:
-                    image = image[:27] + "..."
-                
-                # Port mappings
-                ports = ""
-                if c.ports:
-                    port_list = []
-                    for container_port, host_bindings in c.ports.items():
-                        if host_bindings:
-                            for binding in host_bindings:
-                                port_list.append(f"{binding['HostPort']}→{container_port}")
-                        else:
-                            port_list.append(str(container_port))
-                    ports = ", ".join(port_list[:2])  # Limit to 2 ports
-                    if len(c.ports) > 2:
-                        ports += "..."
-                
-                # Get stats for running containers
-                cpu_usage = "-"
-                mem_usage = "-"
-                if status == "running":
-                    try:
-                        stats = c.stats(stream=False)
-                        
-                        # CPU calculation
-                        cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
-                                   stats['precpu_stats']['cpu_usage']['total_usage']
-                        system_delta = stats['cpu_stats']['system_cpu_usage'] - \
-                                      stats['precpu_stats']['system_cpu_usage']
-                        if system_delta > 0:
-                            cpu_percent = (cpu_delta / system_delta) * \
-                                        len(stats['cpu_stats']['cpu_usage'].get('percpu_usage', [1])) * 100
-                            cpu_usage = f"{cpu_percent:.1f}"
-                        
-                        # Memory calculation
-                        mem_usage_bytes = stats['memory_stats']['usage']
-                        if mem_usage_bytes > 1024**3:
-                            mem_usage = f"{mem_usage_bytes / 1024**3:.1f}G"
-                        else:
-                            mem_usage = f"{mem_usage_bytes / 1024**2:.0f}M"
-                    except:
-                        pass
-                
-                # Uptime
-                created = c.attrs['Created']
-                uptime = self._format_uptime(created) if status == "running" else "-"
-                
-                self.table.add_row(
-                    short_id,
-                    name,
-                    status_text,
-                    image,
-                    ports or "-",
-                    cpu_usage,
-                    mem_usage,
-                    uptime,
-                    key=str(idx)
-                )
-        
-        except DockerException as e:
-            self.notify(f"Docker error: {str(e)}", severity="error")
-    
-    def _format_uptime(self, created_str: str) -> str:
-        """Format container uptime"""
-        try:
-            created = datetime.fromisoformat(created_str.replace('Z', '+00:00'))
-            delta = datetime.now(created.tzinfo) - created
+            # Port mappings
+            ports = _format_ports(c['Ports'])
             
-            days = delta.days
-            hours = delta.seconds // 3600
-            minutes = (delta.seconds % 3600) // 60
+            # Stats for running containers (fetched above)
+            cpu_usage = "-"
+            mem_usage = "-"
+            sample = stats_bus[cid] = {'status': status}
+            stats = stats_by_id.get(cid)
+            if isinstance(stats, BaseException):
+                sample['error'] = str(stats)
+            elif stats is not None:
+                try:
+                    # CPU calculation against the previous refresh's sample
+                    # (one-shot stats leave precpu_stats zeroed)
+                    cur_total = stats['cpu_stats']['cpu_usage']['total_usage']
+                    cur_system = stats['cpu_stats']['system_cpu_usage']
+                    prev = self._prev_cpu.get(cid)
+                    self._prev_cpu[cid] = (cur_total, cur_system)
+                    cpu_delta = cur_total - prev[0] if prev else 0
+                    system_delta = cur_system - prev[1] if prev else 0
+                    if system_delta > 0 and cpu_delta >= 0:
+                        if meta['num_cpus'] is None:
+                            meta['num_cpus'] = len(stats['cpu_stats']['cpu_usage'].get('percpu_usage', [1]))
+                        cpu_percent = (cpu_delta / system_delta) * meta['num_cpus'] * 100
+                        cpu_usage = f"{cpu_percent:.1f}"
+                    else:
+                        cpu_percent = None
+                    
+                    # Memory calculation
+                    mem_usage_bytes = stats['memory_stats']['usage']
+                    sample['cpu_percent'] = cpu_percent
+                    sample['mem_usage'] = mem_usage_bytes
+                    sample['mem_limit'] = stats['memory_stats'].get('limit', 0)
+                    if mem_usage_bytes > 1024**3:
+                        mem_usage = f"{mem_usage_bytes / 1024**3:.1f}G"
+                    else:
+                        mem_usage = f"{mem_usage_bytes / 1024**2:.0f}M"
+                except Exception as e:
+                    sample['error'] = str(e)
+            
+            # Uptime
+            created_dt = meta['created_dt']
+            uptime = self._format_uptime(created_dt, now_utc) if status == "running" and created_dt else "-"
             
-            if days > 0:
-                return f"{days}d{hours}h"
-            elif hours > 0:
-                return f"{hours}h{minutes}m"
+            rows[cid] = (
+                short_id,
+                name,
+                status_text,
+                meta['image'],
+                ports,
+                cpu_usage,
+                mem_usage,
+                uptime,
+            )
+        
+        # Drop cached metadata for containers that are gone
+        self._meta_cache = {cid: v for cid, v in self._meta_cache.items() if cid in rows}
+        self._prev_cpu = {cid: v for cid, v in self._prev_cpu.items() if cid in rows}
+        
+        return {
+            'show_all': show_all,
+            'rows': rows,
+            'status_counts': status_counts,
+            'stats_bus': stats_bus,
+        }
+    
+    def _apply_snapshot(self, snapshot: dict):
+        """Diff a collected snapshot into the table, stats bar and stats bus"""
+        # Drop snapshots collected before the filter was toggled
+        if snapshot['show_all'] != self.show_all:
+            return
+        
+        rows = snapshot['rows']
+        for cid, row in rows.items():
+            # Add new containers, update only the changed cells of known ones
+            old_row = self._row_state.get(cid)
+            if old_row is None:
+                self.table.add_row(*row, key=cid)
             else:
-                return f"{minutes}m"
-        except:
-            return "-"
+                for column_key, old_value, new_value in zip(self._column_keys, old_row, row):
+                    if old_value != new_value:
+                        self.table.update_cell(cid, column_key, new_value, update_width=True)
+            self._row_state[cid] = row
+        
+        status_counts = snapshot['status_counts']
+        self.stats_bar.update_stats(
+            len(rows), status_counts["running"], status_counts["exited"], status_counts["paused"]
+        )
+        
+        # Remove rows for containers that are gone
+        for cid in self._row_state.keys() - rows.keys():
+            self.table.remove_row(cid)
+        self._row_state = {cid: v for cid, v in self._row_state.items() if cid in rows}
+        
+        # Map table positions to container IDs for actions
+        self.container_ids = {idx: row_key.value for idx, row_key in enumerate(self.table.rows)}
+        
+        # Publish stats for the logs view and wake it up
+        self._stats_bus = snapshot['stats_bus']
+        self._stats_event.set()
+        self._stats_event.clear()
+    
+    def _build_meta(self, c: dict) -> dict:
+        """Collect metadata that stays fixed for a container's lifetime"""
+        # Image name (shortened); untagged images are reported by digest
+        image = c['Image']
+        if image.startswith("sha256:"):
+            image = image[:17]
+        if len(image) > 30:
+            image = image[:27] + "..."
+        
+        # Created is a unix timestamp in the list payload
+        created_dt = datetime.fromtimestamp(c['Created'], timezone.utc) if c.get('Created') else None
+        
+        return {
+            'name': c['Names'][0].lstrip('/'),
+            'image': image,
+            'created_dt': created_dt,
+            'num_cpus': None,  # Filled in from the first stats sample
+            'cgroup_dir': _UNSET,  # Resolved on first cgroup stats read
+        }
+    
+    def _format_uptime(self, created_dt: datetime, now_utc: datetime) -> str:
+        """Format container uptime"""
+        seconds = max(int((now_utc - created_dt).total_seconds()), 0)
+        days, seconds = divmod(seconds, 86400)
+        hours, seconds = divmod(seconds, 3600)
+        minutes = seconds // 60
+        
+        if days > 0:
+            return f"{days}d{hours}h"
+        elif hours > 0:
+            return f"{hours}h{minutes}m"
+        else:
+            return f"{minutes}m"
     
-    def action_toggle_filter(self):
+    async def action_toggle_filter(self):
         """Toggle between all containers and running only"""
         self.show_all = not self.show_all
         filter_text = "all" if self.show_all else "running only"
@@ -474,48 +815,68 @@ class DockerTUI(App):
     
     def action_restart_container(self):
         """Restart selected container"""
-        if self.table.cursor_row >= 0:
-            try:
-                container_id = self.container_ids[self.table.cursor_row]
-                container = client.containers.get(container_id)
-                container.restart()
-                self.notify(f"Restarting {container.name}", timeout=2)
-            except Exception as e:
-                self.notify(f"Error: {str(e)}", severity="error")
+        selected = self._claim_action()
+        if selected:
+            container_id, name = selected
+            self._run_action(client.api.restart, container_id, f"Restarting {name}", timeout=10)
     
     def action_stop_container(self):
         """Stop selected container"""
-        if self.table.cursor_row >= 0:
-            try:
-                container_id = self.container_ids[self.table.cursor_row]
-                container = client.containers.get(container_id)
-                container.stop()
-                self.notify(f"Stopping {container.name}", timeout=2)
-            except Exception as e:
-                self.notify(f"Error: {str(e)}", severity="error")
+        selected = self._claim_action()
+        if selected:
+            container_id, name = selected
+            self._run_action(client.api.stop, container_id, f"Stopping {name}")
     
     def action_start_container(self):
         """Start selected container"""
-        if self.table.cursor_row >= 0:
-            try:
-                container_id = self.container_ids[self.table.cursor_row]
-                container = client.containers.get(container_id)
-                container.start()
-                self.notify(f"Starting {container.name}", timeout=2)
-            except Exception as e:
-                self.notify(f"Error: {str(e)}", severity="error")
+        selected = self._claim_action()
+        if selected:
+            container_id, name = selected
+            self._run_action(client.api.start, container_id, f"Starting {name}")
     
     def action_remove_container(self):
         """Remove selected container"""
-        if self.table.cursor_row >= 0:
-            try:
-                container_id = self.container_ids[self.table.cursor_row]
-                container = client.containers.get(container_id)
-                name = container.name
-                container.remove(force=True)
-                self.notify(f"Removed {name}", severity="warning", timeout=2)
-            except Exception as e:
-                self.notify(f"Error: {str(e)}", severity="error")
+        selected = self._claim_action()
+        if selected:
+            container_id, name = selected
+            self._run_action(
+                client.api.remove_container, container_id, f"Removed {name}", severity="warning", force=True
+            )
+    
+    def _claim_action(self) -> tuple[str, str] | None:
+        """Return the selected container's id and name, or None if busy or nothing is selected"""
+        # Key presses arriving while an action runs are dropped, not queued
+        if self.table.cursor_row < 0 or self._action_running:
+            return None
+        container_id = self.container_ids.get(self.table.cursor_row)
+        if container_id is None:
+            return None
+        self._action_running = True
+        # Read the name now; a refresh may prune the cache while the action runs
+        return container_id, self._container_name(container_id)
+    
+    def _container_name(self, container_id: str) -> str:
+        """Name of a listed container, from the metadata cache"""
+        return self._meta_cache.get(container_id, {}).get('name', container_id[:12])
+    
+    def _run_action(self, call, container_id: str, message: str, severity: str = "information", **kwargs):
+        """Run a daemon call for a container in the background"""
+        # Return from the key handler at once so later presses hit the busy check
+        self.run_worker(
+            self._container_action(call, container_id, message, severity, kwargs),
+            group="actions",
+            exclusive=False,
+        )
+    
+    async def _container_action(self, call, container_id: str, message: str, severity: str, kwargs: dict):
+        """Perform a daemon call in a worker thread and report the result"""
+        try:
+            await asyncio.to_thread(call, container_id, **kwargs)
+            self.notify(message, severity=severity, timeout=2)
+        except Exception as e:
+            self.notify(f"Error: {str(e)}", severity="error")
+        finally:
+            self._action_running = False
     
     async def action_logs(self):
         """Show container logs and stats"""
@@ -526,10 +887,9 @@ class DockerTUI(App):
         if self.table.cursor_row >= 0:
             try:
                 container_id = self.container_ids[self.table.cursor_row]
-                container = client.containers.get(container_id)
                 
                 # Switch to logs view
-                await self._show_logs_view(container_id, container.name)
+                await self._show_logs_view(container_id, self._container_name(container_id))
             except Exception as e:
                 self.notify(f"Error: {str(e)}", severity="error")
         else: